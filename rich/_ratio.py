@@ -1,6 +1,4 @@
 import sys
-from fractions import Fraction
-from math import ceil
 from typing import cast, List, Optional, Sequence
 
 if sys.version_info >= (3, 8):
@@ -34,44 +32,55 @@ def ratio_resolve(total: int, edges: Sequence[Edge]) -> List[int]:
         List[int]: Number of characters for each edge.
     """
     # Size of edge or None for yet to be determined
-    sizes = [(edge.size or None) for edge in edges]
-
-    _Fraction = Fraction
+    sizes: List[Optional[int]] = [edge.size for edge in edges]
+    if None not in sizes:
+        # Every edge has a fixed size, nothing to resolve
+        return cast(List[int], sizes)
+
+    _divmod = divmod
+
+    # Flexible edges and index to map these back on to sizes list
+    flexible_edges = [
+        (index, edge)
+        for index, (size, edge) in enumerate(zip(sizes, edges))
+        if size is None
+    ]
+    # Remaining space in total, and the ratio it is shared between.
+    # Both are updated as edges are fixed, rather than recalculated.
+    if len(flexible_edges) == len(sizes):
+        remaining = total
+    else:
+        remaining = total - sum(size or 0 for size in sizes)
+    total_ratio = sum((edge.ratio or 1) for _, edge in flexible_edges)
 
     # While any edges haven't been calculated
-    while None in sizes:
-        # Get flexible edges and index to map these back on to sizes list
-        flexible_edges = [
-            (index, edge)
-            for index, (size, edge) in enumerate(zip(sizes, edges))
-            if size is None
-        ]
-        # Remaining space in total
-        remaining = total - sum(size or 0 for size in sizes)
+    while flexible_edges:
         if remaining <= 0:
             # No room for flexible edges
             return [
                 ((edge.minimum_size or 1) if size is None else size)
                 for size, edge in zip(sizes, edges)
             ]
-        # Calculate number of characters in a ratio portion
-        portion = _Fraction(
-            remaining, sum((edge.ratio or 1) for _, edge in flexible_edges)
-        )
 
         # If any edges will be less than their minimum, replace size with the minimum
-        for index, edge in flexible_edges:
-            if portion * edge.ratio <= edge.minimum_size:
+        # (portion * ratio <= minimum, cross-multiplied to stay in integers)
+        for position, (index, edge) in enumerate(flexible_edges):
+            if remaining * edge.ratio <= edge.minimum_size * total_ratio:
                 sizes[index] = edge.minimum_size
+                remaining -= edge.minimum_size or 0
+                total_ratio -= edge.ratio or 1
+                del flexible_edges[position]
                 # New fixed size will invalidate calculations, so we need to repeat the process
                 break
         else:
             # Distribute flexible space and compensate for rounding error
-            # Since edge sizes can only be integers we need to add the remainder
-            # to the following line
-            remainder = _Fraction(0)
+            # Since edge sizes can only be integers we need to carry the remainder
+            # to the following edge (kept as a numerator over total_ratio)
+            remainder = 0
             for index, edge in flexible_edges:
-                size, remainder = divmod(portion * edge.ratio + remainder, 1)
+                size, remainder = _divmod(
+                    edge.ratio * remaining + remainder, total_ratio
+                )
                 sizes[index] = size
             break
     # Sizes now contains integers only
@@ -92,16 +101,26 @@ def ratio_reduce(
     Returns:
         List[int]: A list of integers guaranteed to sum to total.
     """
-    ratios = [ratio if _max else 0 for ratio, _max in zip(ratios, maximums)]
-    total_ratio = sum(ratios)
+    # Slots with no maximum take no share; they are skipped in the loop below
+    # rather than copied to a separate list of masked ratios
+    total_ratio = sum(ratio for ratio, maximum in zip(ratios, maximums) if maximum)
     if not total_ratio:
         return values[:]
     total_remaining = total
     result: List[int] = []
     append = result.append
+    _divmod = divmod
+    _min = min
     for ratio, maximum, value in zip(ratios, maximums, values):
-        if ratio and total_ratio > 0:
-            distributed = min(maximum, round(ratio * total_remaining / total_ratio))
+        if ratio and maximum and total_ratio > 0:
+            # Integer equivalent of round(ratio * total_remaining / total_ratio)
+            distributed, remainder = _divmod(ratio * total_remaining, total_ratio)
+            remainder *= 2
+            if remainder > total_ratio or (
+                remainder == total_ratio and distributed & 1
+            ):
+                distributed += 1
+            distributed = _min(maximum, distributed)
             append(value - distributed)
             total_remaining -= distributed
             total_ratio -= ratio
@@ -131,13 +150,26 @@ def ratio_distribute(
     total_remaining = total
     distributed_total: List[int] = []
     append = distributed_total.append
+    if minimums is None and total >= 0:
+        # Fast path: with no minimums and a non-negative total, every share is
+        # already >= 0, so there is no need to build or clamp to a minimums list
+        for ratio in ratios:
+            if total_ratio > 0:
+                distributed = -(-ratio * total_remaining // total_ratio)
+            else:
+                distributed = total_remaining
+            append(distributed)
+            total_ratio -= ratio
+            total_remaining -= distributed
+        return distributed_total
     if minimums is None:
         _minimums = [0] * len(ratios)
     else:
         _minimums = minimums
+    _max = max
     for ratio, minimum in zip(ratios, _minimums):
         if total_ratio > 0:
-            distributed = max(minimum, ceil(ratio * total_remaining / total_ratio))
+            distributed = _max(minimum, -(-ratio * total_remaining // total_ratio))
         else:
             distributed = total_remaining
         append(distributed)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 from .align import AlignMethod
@@ -5,10 +6,29 @@ from .cells import cell_len, set_cell_size
 from .console import Console, ConsoleOptions, RenderResult
 from .jupyter import JupyterMixin
 from .measure import Measurement
+from .segment import Segment
 from .style import Style
 from .text import Text
 
 
+@lru_cache(maxsize=32)
+def _make_line(characters: str, width: int) -> str:
+    """Repeat characters to fill exactly `width` cells.
+
+    Args:
+        characters (str): Character(s) used to draw the line.
+        width (int): Number of cells to fill.
+
+    Returns:
+        str: Line of characters, padded with a space if a wide character doesn't fit.
+    """
+    if width <= 0:
+        return ""
+    # Whole repeats fit exactly, so only the final partial repeat needs resizing
+    repeats, remainder = divmod(width, cell_len(characters))
+    return characters * repeats + set_cell_size(characters, remainder)
+
+
 class Rule(JupyterMixin):
     """A console renderable to draw a horizontal rule (line).
 
@@ -20,6 +40,8 @@ class Rule(JupyterMixin):
         align (str, optional): How to align the title, one of "left", "center", or "right". Defaults to "center".
     """
 
+    __slots__ = ["title", "characters", "style", "end", "align"]
+
     def __init__(
         self,
         title: Union[str, Text] = "",
@@ -57,9 +79,8 @@ class Rule(JupyterMixin):
             else self.characters
         )
 
-        chars_len = cell_len(characters)
         if not self.title:
-            yield self._rule_line(chars_len, width)
+            yield self._rule_line(characters, width)
             return
 
         if isinstance(self.title, Text):
@@ -73,40 +94,41 @@ class Rule(JupyterMixin):
         required_space = 4 if self.align == "center" else 2
         truncate_width = max(0, width - required_space)
         if not truncate_width:
-            yield self._rule_line(chars_len, width)
+            yield self._rule_line(characters, width)
             return
 
-        rule_text = Text(end=self.end)
+        title_text.truncate(truncate_width, overflow="ellipsis")
+        title_length = cell_len(title_text.plain)
+
+        style = console.get_style(self.style, default=Style.null())
+        # Text.render only applies the base style via spans, so apply it here too
+        title_style = console.get_style(title_text.style, default=Style.null())
+        title = Segment.apply_style(title_text.render(console), title_style)
+
+        # Lines and title are an exact fit, so segments may be yielded directly
         if self.align == "center":
-            title_text.truncate(truncate_width, overflow="ellipsis")
-            side_width = (width - cell_len(title_text.plain)) // 2
-            left = Text(characters * (side_width // chars_len + 1))
-            left.truncate(side_width - 1)
-            right_length = width - cell_len(left.plain) - cell_len(title_text.plain)
-            right = Text(characters * (side_width // chars_len + 1))
-            right.truncate(right_length)
-            rule_text.append(left.plain + " ", self.style)
-            rule_text.append(title_text)
-            rule_text.append(" " + right.plain, self.style)
+            side_width = (width - title_length) // 2
+            left = _make_line(characters, side_width - 1)
+            right = _make_line(characters, width - side_width - title_length - 1)
+            yield Segment(left + " ", style)
+            yield from title
+            yield Segment(" " + right, style)
         elif self.align == "left":
-            title_text.truncate(truncate_width, overflow="ellipsis")
-            rule_text.append(title_text)
-            rule_text.append(" ")
-            rule_text.append(characters * (width - rule_text.cell_len), self.style)
+            yield from title
+            yield Segment(" ")
+            yield Segment(_make_line(characters, width - title_length - 1), style)
         elif self.align == "right":
-            title_text.truncate(truncate_width, overflow="ellipsis")
-            rule_text.append(characters * (width - title_text.cell_len - 1), self.style)
-            rule_text.append(" ")
-            rule_text.append(title_text)
-
-        rule_text.plain = set_cell_size(rule_text.plain, width)
-        yield rule_text
-
-    def _rule_line(self, chars_len: int, width: int) -> Text:
-        rule_text = Text(self.characters * ((width // chars_len) + 1), self.style)
-        rule_text.truncate(width)
-        rule_text.plain = set_cell_size(rule_text.plain, width)
-        return rule_text
+            yield Segment(_make_line(characters, width - title_length - 1), style)
+            yield Segment(" ")
+            yield from title
+        if self.end:
+            yield Segment(self.end)
+
+    def _rule_line(self, characters: str, width: int) -> Text:
+        if len(characters) == 1 and cell_len(characters) == 1:
+            # A single cell-wide character repeats to exactly width cells
+            return Text(characters * width, self.style)
+        return Text(_make_line(characters, width), self.style)
 
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
@@ -1,7 +1,7 @@
 import pytest
 from typing import NamedTuple, Optional
 
-from rich._ratio import ratio_reduce, ratio_resolve
+from rich._ratio import ratio_distribute, ratio_reduce, ratio_resolve
 
 
 class Edge(NamedTuple):
@@ -25,10 +25,29 @@ def test_ratio_reduce(total, ratios, maximums, values, result):
     assert ratio_reduce(total, ratios, maximums, values) == result
 
 
+@pytest.mark.parametrize(
+    "total,ratios,minimums,result",
+    [
+        (10, [1], None, [10]),
+        (10, [1, 1], None, [5, 5]),
+        (12, [1, 4], None, [3, 9]),
+        (12, [1, 3], [1, 1], [3, 9]),
+        (101, [1, 1, 1], None, [34, 34, 33]),
+        (10, [1, 1], [8, 0], [10, 0]),
+        (10, [1, 1], [0, 1], [0, 10]),
+        (25, [1] * 10, None, [3, 3, 3, 3, 3, 2, 2, 2, 2, 2]),
+        (25, [1] * 10, [4] + [1] * 9, [4, 3, 3, 3, 2, 2, 2, 2, 2, 2]),
+    ],
+)
+def test_ratio_distribute(total, ratios, minimums, result):
+    assert ratio_distribute(total, ratios, minimums) == result
+
+
 def test_ratio_resolve():
     assert ratio_resolve(100, []) == []
     assert ratio_resolve(100, [Edge(size=100), Edge(ratio=1)]) == [100, 1]
     assert ratio_resolve(100, [Edge(ratio=1)]) == [100]
+    assert ratio_resolve(100, [Edge(size=0), Edge(ratio=1)]) == [0, 100]
     assert ratio_resolve(100, [Edge(ratio=1), Edge(ratio=1)]) == [50, 50]
     assert ratio_resolve(100, [Edge(size=20), Edge(ratio=1), Edge(ratio=1)]) == [
         20,
@@ -56,3 +75,11 @@ def test_ratio_resolve():
         37,
         37,
     ]
+
+
+def test_ratio_resolve_minimum_size():
+    edges = [Edge(ratio=1, minimum_size=5) for _ in range(20)]
+    edges.append(Edge(ratio=10))
+    resolved = ratio_resolve(100, edges)
+    assert resolved[:20] == [5] * 20
+    assert resolved[20] == 1
@@ -4,6 +4,7 @@ import pytest
 
 from rich.console import Console
 from rich.rule import Rule
+from rich.segment import Segment
 from rich.text import Text
 
 
@@ -114,9 +115,13 @@ def test_characters():
     console.rule(characters="+*")
     console.rule("foo", characters="+*")
     console.print(Rule(characters=".,"))
+    console.rule("foo", characters="+*", align="left")
+    console.rule("foo", characters="+*", align="right")
     expected = "+*+*+*+*+*+*+*+*\n"
     expected += "+*+*+ foo +*+*+*\n"
     expected += ".,.,.,.,.,.,.,.,\n"
+    expected += "foo +*+*+*+*+*+*\n"
+    expected += "+*+*+*+*+*+* foo\n"
     assert console.file.getvalue() == expected
 
 
@@ -128,3 +133,18 @@ def test_repr():
 def test_error():
     with pytest.raises(ValueError):
         Rule(characters="")
+
+
+def test_rule_ascii_only():
+    console = Console(
+        width=8,
+        file=io.StringIO(),
+        color_system=None,
+        legacy_windows=False,
+        _environ={},
+    )
+    options = console.options.copy()
+    options.encoding = "ascii"
+    lines = console.render_lines(Rule(), options)
+    assert [Segment.get_line_length(line) for line in lines] == [8]
+    assert "".join(segment.text for segment in lines[0]) == "--------"